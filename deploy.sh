@@ -55,7 +55,7 @@ cp "${SCRIPT_DIR}/skills/meal-plan/SKILL.md" "${SKILL_DIR}/SKILL.md"
 echo "✓ Copied SKILL.md"
 
 # Copy execution scripts
-for script in kroger_api.py meal_planner.py grocery_list.py meal_config.py recipe_manager.py; do
+for script in kroger_api.py kroger_cache.py meal_planner.py grocery_list.py meal_config.py recipe_manager.py; do
     if [[ -f "${SCRIPT_DIR}/execution/${script}" ]]; then
         cp "${SCRIPT_DIR}/execution/${script}" "${INSTALL_DIR}/execution/${script}"
         chmod +x "${INSTALL_DIR}/execution/${script}"
@@ -13,25 +13,53 @@ Usage:
     # Just resolve a simple item list
     python grocery_list.py --items '["chicken breast 1.5 lb", "broccoli 2 cups"]' --location 01400943
 
+    # Ignore cached Kroger responses and search live
+    python grocery_list.py --plan .tmp/meal_plan.json --no-cache
+
+    # Warm the response cache ahead of time without building a cart
+    python grocery_list.py --plan .tmp/meal_plan.json --dry-run-fetch
+
+    # Re-rank from cached searches only (no network). Each item is ranked
+    # against every cached result for the plan, so picks can differ from a
+    # live run that only sees the item's own search results.
+    python grocery_list.py --plan .tmp/meal_plan.json --location 01400943 --rerank-cache
+
 Output: JSON with resolved products and cart-ready items written to .tmp/grocery_cart.json
 """
 
 import argparse
-import json
+import functools
 import os
 import re
 import sys
-import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Import our modules
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-from meal_config import load_env
+# Skip if already on sys.path (always true when run as a script)
+_EXEC_DIR = str(Path(__file__).parent)
+if _EXEC_DIR not in sys.path:
+    sys.path.insert(0, _EXEC_DIR)
+from meal_config import (
+    MEAL_PLAN_PATH,
+    ROOT_DIR,
+    json_dumpb,
+    json_loads,
+    load_env,
+    write_json,
+)
 
 load_env()
 
 from kroger_api import KrogerClient
 
+# Default output next to the other run artifacts in .tmp/
+CART_PATH = ROOT_DIR / ".tmp" / "grocery_cart.json"
+
+# Concurrent Kroger searches per cart build
+MAX_WORKERS = 8
+
 # Kroger category → expected grocery categories mapping
 _EXPECTED_KROGER_CATEGORIES = {
     "produce": ["produce"],
@@ -67,49 +95,15 @@ _NON_FOOD_CATEGORIES = [
 ]
 
 
-def _score_product(product, item_name, category):
-    """
-    Score a product match. Higher is better.
-    Penalizes irrelevant matches (e.g. dog food for "brown rice").
-    Uses Kroger metadata: categories, snapEligible, aisleLocations.
-    """
-    desc = (product.get("description") or "").lower()
-    brand = (product.get("brand") or "").lower()
-    kroger_cats = [c.lower() for c in product.get("categories", [])]
-    snap_eligible = product.get("snapEligible", True)
-    name_lower = item_name.lower()
-    # Strip parentheses so "(fresh)" becomes "fresh" for word matching
-    name_clean = re.sub(r"[()]", "", name_lower).strip()
-    name_words = name_clean.split()
-
-    score = 0
-
-    # ── SNAP eligibility: strongest signal for "is this food?" ──
-    food_categories = {"produce", "meat", "dairy", "pantry", "frozen", "bakery"}
-    if category in food_categories and not snap_eligible:
-        score -= 100
-
-    # ── Kroger category validation ──
-    expected = _EXPECTED_KROGER_CATEGORIES.get(category, [])
-    if expected and kroger_cats:
-        if any(exp in kc for exp in expected for kc in kroger_cats):
-            score += 15
-    for nf_cat in _NON_FOOD_CATEGORIES:
-        if any(nf_cat in kc for kc in kroger_cats):
-            score -= 30
-
-    # ── Word matching ──
-    matched_words = sum(1 for w in name_words if w in desc)
-    score += matched_words * 10
-
-    # Bonus: description starts with or closely matches the item name
-    if name_clean in desc:
-        score += 20
-    if desc.startswith(name_clean) or desc.startswith(name_words[-1]):
-        score += 10
+# Item-name cleanup: "ginger (fresh)" parsing and parenthesis stripping
+_PAREN_RE = re.compile(r"^(.+?)\s*\((.+?)\)\s*$")
+_PARENS_STRIP_RE = re.compile(r"[()]")
 
-    # ── Junk signals in description/brand ──
-    junk_signals = [
+# Description signals, matched where a word starts: plurals and compounds
+# still hit ("dogs", "vitamins", "teabags") but "tea" no longer hits "steak"
+# or "cat" hits "delicate".
+_JUNK_SIGNALS = frozenset(
+    [
         "dog",
         "cat",
         "pet",
@@ -136,94 +130,222 @@ def _score_product(product, item_name, category):
         "wellness shot",
         "protein shake",
     ]
-    for junk in junk_signals:
-        if junk in desc or junk in brand:
-            score -= 50
-
-    # ── Beverage signals when searching for produce/pantry ingredients ──
-    if category in {"produce", "pantry", "meat", "dairy"}:
-        beverage_signals = [
-            "juice",
-            "blend",
-            "cold-pressed",
-            "smoothie",
-            "drink",
-            "soda",
-            "water",
-            "tea",
-            "coffee",
-            "lemonade",
-        ]
-        for sig in beverage_signals:
-            if sig in desc and sig not in name_lower:
-                score -= 20
-                break
-
-    # ── Freshness modifiers ──
-    if "fresh" in name_lower:
-        if any(x in desc for x in ["freeze dried", "frozen", "canned", "dried"]):
-            # Only penalize "dried" if it's standalone, not part of the item name
-            if "dried" not in name_lower:
-                score -= 15
-        if "fresh" in desc:
-            score += 10
+)
+_BEVERAGE_SIGNALS = frozenset(
+    [
+        "juice",
+        "blend",
+        "cold-pressed",
+        "smoothie",
+        "drink",
+        "soda",
+        "water",
+        "tea",
+        "coffee",
+        "lemonade",
+    ]
+)
+_PREPARED_SIGNALS = frozenset(
+    [
+        "cup",
+        "cups",
+        "kit",
+        "meal kit",
+        "seasoning mix",
+        "frozen dinner",
+        "tv dinner",
+    ]
+)
+
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Compounds whose signal doesn't start a word of its own
+_SIGNAL_ALIASES = {"multivitamin": "vitamin"}
+
+# One matcher for every signal list, so each text is scanned once. The
+# lookahead reports the longest signal at each word start; _SIGNAL_HITS
+# expands it to every signal it implies ("cups" also counts as "cup").
+_ALL_SIGNALS = _JUNK_SIGNALS | _BEVERAGE_SIGNALS | _PREPARED_SIGNALS
+_SIGNAL_HITS = {
+    s: frozenset(p for p in _ALL_SIGNALS if s.startswith(p)) for s in _ALL_SIGNALS
+}
+_SIGNAL_HITS.update((a, frozenset([s])) for a, s in _SIGNAL_ALIASES.items())
+_SIGNAL_RE = re.compile(
+    r"\b(?=("
+    + "|".join(re.escape(s) for s in sorted(_SIGNAL_HITS, key=lambda s: (-len(s), s)))
+    + "))"
+)
 
-    # ── Penalize prepared items when searching for raw ingredients ──
-    raw_categories = {"produce", "meat", "dairy", "pantry"}
-    if category in raw_categories:
-        prepared_signals = [
-            "cup",
-            "cups",
-            "kit",
-            "meal kit",
-            "seasoning mix",
-            "frozen dinner",
-            "tv dinner",
-        ]
-        for sig in prepared_signals:
-            if sig in desc and sig not in name_lower:
-                score -= 10
 
-    # ── Prefer items with pricing ──
-    items_data = product.get("items", [{}])
-    if items_data and items_data[0].get("price", {}).get("regular"):
-        score += 5
+@functools.lru_cache(maxsize=4096)
+def _find_signals(text):
+    """
+    Return the scorer signals present in lowercased text.
+    Memoized: the same product descriptions and brands come back for many
+    similar items ("chicken", "chicken breast") and in --rerank-cache runs.
+    """
+    signals = set()
+    for hit in _SIGNAL_RE.findall(text):
+        signals |= _SIGNAL_HITS[hit]
+    return frozenset(signals)
+
+
+_NOT_FRESH = ("freeze dried", "frozen", "canned", "dried")
+
+_FOOD_CATEGORIES = frozenset(["produce", "meat", "dairy", "pantry", "frozen", "bakery"])
+_RAW_CATEGORIES = frozenset(["produce", "meat", "dairy", "pantry"])
 
+
+@functools.lru_cache(maxsize=1024)
+def _category_score(kroger_cats, category):
+    """
+    Score adjustment from a product's Kroger categories (a tuple, so the
+    result is memoized; stores reuse a small set of category lists).
+    """
+    cats = [c.lower() for c in kroger_cats]
+    score = 0
+    expected = _EXPECTED_KROGER_CATEGORIES.get(category, [])
+    if expected and cats:
+        if any(exp in kc for exp in expected for kc in cats):
+            score += 15
+    for nf_cat in _NON_FOOD_CATEGORIES:
+        if any(nf_cat in kc for kc in cats):
+            score -= 30
     return score
 
 
+def _score_batch(products, item_name, category):
+    """
+    Score candidate products for one grocery item. Higher is better.
+    Penalizes irrelevant matches (e.g. dog food for "brown rice").
+    Uses Kroger metadata: categories, snapEligible.
+
+    Everything that depends only on the item (name cleanup, signal scan,
+    category lookups) is computed once per batch, not once per product.
+
+    Stages run in order and a product is abandoned (scored None) as soon as
+    the most the remaining stages could add still leaves it below the best
+    score seen so far in the batch. Strictly below, so price tie-breaks hold.
+    """
+    name_lower = item_name.lower()
+    # Strip parentheses so "(fresh)" becomes "fresh" for word matching
+    name_clean = _PARENS_STRIP_RE.sub("", name_lower).strip()
+    name_words = name_clean.split()
+    last_word = name_words[-1] if name_words else name_clean
+    name_signals = _find_signals(name_lower)
+    check_snap = category in _FOOD_CATEGORIES
+    raw_ingredient = category in _RAW_CATEGORIES
+    wants_fresh = "fresh" in name_lower
+    # Only penalize "dried" if it's standalone, not part of the item name
+    penalize_not_fresh = wants_fresh and "dried" not in name_lower
+
+    # Most each checkpoint's remaining stages can add: category match +15,
+    # +10 per name word, +20 contains name, +10 starts with it, +10 fresh,
+    # +5 priced. Everything else only subtracts.
+    max_after_words = (10 if wants_fresh else 0) + 5
+    max_after_categories = 10 * len(name_words) + 30 + max_after_words
+    max_after_snap = 15 + max_after_categories
+    floor = float("-inf")
+
+    scores = []
+    for product in products:
+        desc = (product.get("description") or "").lower()
+        brand = (product.get("brand") or "").lower()
+
+        score = 0
+
+        # ── SNAP eligibility: strongest signal for "is this food?" ──
+        if check_snap and not product.get("snapEligible", True):
+            score -= 100
+        if score + max_after_snap < floor:
+            scores.append(None)
+            continue
+
+        # ── Kroger category validation ──
+        score += _category_score(tuple(product.get("categories", [])), category)
+        if score + max_after_categories < floor:
+            scores.append(None)
+            continue
+
+        # ── Word matching ──
+        # Substring on purpose: "breast" should still match "breasts"
+        matched_words = sum(1 for w in name_words if w in desc)
+        score += matched_words * 10
+
+        # Bonus: description starts with or closely matches the item name
+        if name_clean in desc:
+            score += 20
+        if desc.startswith(name_clean) or desc.startswith(last_word):
+            score += 10
+        if score + max_after_words < floor:
+            scores.append(None)
+            continue
+
+        # ── Junk signals in description/brand ──
+        desc_signals = _find_signals(desc)
+        score -= 50 * len((desc_signals | _find_signals(brand)) & _JUNK_SIGNALS)
+        if score + max_after_words < floor:
+            scores.append(None)
+            continue
+
+        # ── Beverage signals when searching for produce/pantry ingredients ──
+        if raw_ingredient and (desc_signals & _BEVERAGE_SIGNALS) - name_signals:
+            score -= 20
+
+        # ── Freshness modifiers ──
+        if wants_fresh:
+            if penalize_not_fresh and any(x in desc for x in _NOT_FRESH):
+                score -= 15
+            if "fresh" in desc:
+                score += 10
+
+        # ── Penalize prepared items when searching for raw ingredients ──
+        if raw_ingredient:
+            score -= 10 * len((desc_signals & _PREPARED_SIGNALS) - name_signals)
+
+        # ── Prefer items with pricing ──
+        items_data = product.get("items", [{}])
+        if items_data and items_data[0].get("price", {}).get("regular"):
+            score += 5
+
+        scores.append(score)
+        floor = max(floor, score)
+
+    return scores
+
+
 def _clean_search_query(item_name):
     """
     Normalize item names for better Kroger search results.
     E.g. "ginger (fresh)" → "fresh ginger", "chicken thighs (boneless)" → "boneless chicken thighs"
     """
-    match = re.match(r"^(.+?)\s*\((.+?)\)\s*$", item_name)
+    match = _PAREN_RE.match(item_name)
     if match:
         base, modifier = match.group(1).strip(), match.group(2).strip()
         return f"{modifier} {base}"
     return item_name
 
 
-def resolve_grocery_item(
-    client, item_name, quantity, unit, location_id, category="other"
-):
-    """
-    Search Kroger for a grocery item and return the best match with pricing.
-    Returns dict with product info or None if not found.
-    """
-    search_query = _clean_search_query(item_name)
+def _search_products(client, search_query, location_id):
+    """Fetch raw Kroger candidates for a query. Returns [] if the search fails."""
     try:
         result = client.search_products(search_query, location_id, limit=10)
-        products = result.get("data", [])
+        return result.get("data", [])
     except Exception as e:
-        print(f"  Warning: Search failed for '{item_name}': {e}", file=sys.stderr)
-        return None
+        print(f"  Warning: Search failed for '{search_query}': {e}", file=sys.stderr)
+        return []
+
 
+def _pick_best_product(products, item_name, quantity, unit, category="other"):
+    """
+    Score Kroger candidates for a grocery item and return the best match with
+    pricing, or None if nothing usable was found. Pure CPU, no network.
+    """
     if not products:
         return None
 
-    # Score and rank all candidates
-    scored = []
+    # Drop candidates with no item data or that are out of stock
+    candidates = []
     for p in products:
         items = p.get("items", [])
         if not items:
@@ -232,16 +354,23 @@ def resolve_grocery_item(
         stock = item_data.get("inventory", {}).get("stockLevel", "")
         if stock == "TEMPORARILY_OUT_OF_STOCK":
             continue
-        score = _score_product(p, item_name, category)
-        price = item_data.get("price", {}).get("regular") or 999
-        scored.append((score, price, p, item_data))
+        candidates.append((p, item_data))
+
+    # Score all candidates, then keep the best in one pass: score descending,
+    # then price ascending (cheaper wins ties, earlier result wins full ties)
+    scores = _score_batch([p for p, _ in candidates], item_name, category)
+    best = None
+    for score, (p, item_data) in zip(scores, candidates):
+        if score is None:
+            continue
+        rank = (-score, item_data.get("price", {}).get("regular") or 999)
+        if best is None or rank < best[0]:
+            best = (rank, score, p, item_data)
 
-    if not scored:
+    if best is None:
         return None
 
-    # Sort by score descending, then price ascending (cheaper wins ties)
-    scored.sort(key=lambda x: (-x[0], x[1]))
-    best_score, _, best_product, best_item = scored[0]
+    _, best_score, best_product, best_item = best
 
     price_info = best_item.get("price", {})
     regular_price = price_info.get("regular")
@@ -265,12 +394,147 @@ def resolve_grocery_item(
     }
 
 
-def build_grocery_cart(meal_plan_path, location_id, items_json=None):
+def _item_key(item_name, category):
+    """Dedupe key: items that normalize to the same search share one result."""
+    return _clean_search_query(item_name).lower(), category
+
+
+def resolve_grocery_item(
+    client, item_name, quantity, unit, location_id, category="other"
+):
+    """
+    Search Kroger for a grocery item and return the best match with pricing.
+    Returns dict with product info or None if not found.
+    """
+    products = _search_products(client, _clean_search_query(item_name), location_id)
+    return _pick_best_product(products, item_name, quantity, unit, category)
+
+
+class ProductIndex:
+    """
+    Inverted index over a pool of cached products, used by --rerank-cache.
+
+    Maps description tokens and 3-letter token prefixes to product ids so an
+    item's candidates come from set lookups instead of scoring the whole pool.
+    Exact and prefix hits are combined, so "breast" also finds "breasts".
+    """
+
+    def __init__(self, products):
+        self.products = {}
+        self.by_token = defaultdict(set)
+        self.by_prefix = defaultdict(set)
+        for p in products:
+            pid = p.get("productId")
+            if not pid or pid in self.products:
+                continue
+            self.products[pid] = p
+            for token in _TOKEN_RE.findall((p.get("description") or "").lower()):
+                self.by_token[token].add(pid)
+                self.by_prefix[token[:3]].add(pid)
+
+    def candidates(self, item_name):
+        """
+        Products sharing at least one word (or word prefix) with item_name,
+        in pool order so full ties break the same way on every run.
+        """
+        ids = set()
+        for word in _TOKEN_RE.findall(item_name.lower()):
+            ids |= self.by_token.get(word, set())
+            ids |= self.by_prefix.get(word[:3], set())
+        return [p for pid, p in self.products.items() if pid in ids]
+
+
+def _fetch_all(client, queries, location_id):
+    """
+    Phase 1: run every distinct search concurrently.
+    Returns {search_query: [raw products]}; responses also land in the disk cache.
+    """
+    queries = list(dict.fromkeys(queries))
+    raw = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_search_products, client, q, location_id): q
+            for q in queries
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            query = futures[future]
+            raw[query] = future.result()
+            print(f"  [{done}/{len(queries)}] Searched: {query}", file=sys.stderr)
+    return raw
+
+
+def _rank_all(raw, work, index=None):
+    """
+    Phase 2: pick the best product for each grocery item from the fetched
+    candidates. Returns (resolved, not_found, total) in plan order.
+
+    With an index, candidates come from the whole cached pool rather than
+    only the item's own search results, so an item can pick a product that
+    another item's search found and the result can differ from a live run.
+    """
+    resolved = []
+    not_found = []
+    total = 0
+
+    # Searches are shared per cleaned query, but scoring reads the item name
+    # itself, so only rows with the same name and category share a pick
+    best = {}
+    for item_name, quantity, unit, category in work:
+        key = (item_name.lower(), category)
+        if key not in best:
+            if index:
+                candidates = index.candidates(item_name)
+            else:
+                candidates = raw.get(_item_key(item_name, category)[0])
+            best[key] = _pick_best_product(
+                candidates, item_name, quantity, unit, category
+            )
+        product = best[key]
+        if product:
+            product = dict(
+                product,
+                search_query=item_name,
+                requested_quantity=quantity,
+                requested_unit=unit,
+                category=category,
+                cart_quantity=1,  # Default to 1 unit; user can adjust
+            )
+            if product["effective_price"]:
+                total += product["effective_price"]
+            resolved.append(product)
+        else:
+            not_found.append(
+                {
+                    "item": item_name,
+                    "quantity": quantity,
+                    "unit": unit,
+                    "category": category,
+                }
+            )
+
+    return resolved, not_found, total
+
+
+def build_grocery_cart(
+    meal_plan_path,
+    location_id,
+    items_json=None,
+    use_cache=True,
+    fetch_only=False,
+    rerank_cache=False,
+):
     """
     Read a meal plan and resolve each grocery item to a Kroger product.
     Returns a structured cart-ready list.
+
+    With fetch_only, stop after the searches (warming the disk cache) and
+    return a summary instead of a cart. With rerank_cache, make no network
+    calls: rank every item against the pooled cached search results (which
+    can pick differently from a live run; see _rank_all).
     """
-    client = KrogerClient()
+    if rerank_cache and not location_id:
+        raise ValueError("--rerank-cache needs --location or KROGER_LOCATION_ID")
+    client = KrogerClient(use_cache=use_cache, cache_only=rerank_cache)
 
     # If no location_id, find the nearest store
     if not location_id:
@@ -287,52 +551,39 @@ def build_grocery_cart(meal_plan_path, location_id, items_json=None):
     # Load grocery items
     if items_json:
         grocery_items = [
-            {"item": i, "quantity": 1, "unit": "each"} for i in json.loads(items_json)
+            {"item": i, "quantity": 1, "unit": "each"} for i in json_loads(items_json)
         ]
     elif meal_plan_path:
-        plan = json.loads(Path(meal_plan_path).read_text())
+        plan = json_loads(Path(meal_plan_path).read_bytes())
         grocery_items = plan.get("grocery_list", [])
     else:
         raise ValueError("Provide --plan or --items")
 
-    # Resolve each item
-    resolved = []
-    not_found = []
-    total = 0
-
-    for idx, gi in enumerate(grocery_items):
+    work = []
+    for gi in grocery_items:
         item_name = gi.get("item", gi) if isinstance(gi, dict) else gi
         quantity = gi.get("quantity", 1) if isinstance(gi, dict) else 1
         unit = gi.get("unit", "each") if isinstance(gi, dict) else "each"
         category = gi.get("category", "other") if isinstance(gi, dict) else "other"
+        work.append((item_name, quantity, unit, category))
 
-        print(
-            f"  [{idx + 1}/{len(grocery_items)}] Searching: {item_name}...",
-            file=sys.stderr,
-        )
-
-        product = resolve_grocery_item(
-            client, item_name, quantity, unit, location_id, category
-        )
-
-        if product:
-            product["category"] = category
-            product["cart_quantity"] = 1  # Default to 1 unit; user can adjust
-            if product["effective_price"]:
-                total += product["effective_price"]
-            resolved.append(product)
-        else:
-            not_found.append(
-                {
-                    "item": item_name,
-                    "quantity": quantity,
-                    "unit": unit,
-                    "category": category,
-                }
-            )
-
-        # Rate limit: Kroger allows 10k product calls/day, be polite
-        time.sleep(0.3)
+    # Fetch all searches first, then score offline so the two never interleave
+    raw = _fetch_all(
+        client,
+        [_item_key(name, category)[0] for name, _, _, category in work],
+        location_id,
+    )
+    if fetch_only:
+        return {
+            "location_id": location_id,
+            "queries_fetched": len(raw),
+            "queries_empty": sum(1 for products in raw.values() if not products),
+        }
+
+    index = None
+    if rerank_cache:
+        index = ProductIndex(p for products in raw.values() for p in products)
+    resolved, not_found, total = _rank_all(raw, work, index)
 
     result = {
         "location_id": location_id,
@@ -354,30 +605,56 @@ def main():
     parser.add_argument(
         "--output", help="Output file (default: .tmp/grocery_cart.json)"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass cached Kroger responses"
+    )
+    parser.add_argument(
+        "--dry-run-fetch",
+        action="store_true",
+        help="Only run the searches to warm the cache; no cart is written",
+    )
+    parser.add_argument(
+        "--rerank-cache",
+        action="store_true",
+        help=(
+            "Rank items against all cached search results for the plan (no "
+            "network calls); picks can differ from a live run"
+        ),
+    )
     args = parser.parse_args()
 
+    if args.no_cache and (args.dry_run_fetch or args.rerank_cache):
+        parser.error("--dry-run-fetch and --rerank-cache need the cache enabled")
+
     if not args.plan and not args.items:
-        default_plan = (
-            Path(__file__).resolve().parent.parent / ".tmp" / "meal_plan.json"
-        )
-        if default_plan.exists():
-            args.plan = str(default_plan)
+        if MEAL_PLAN_PATH.exists():
+            args.plan = str(MEAL_PLAN_PATH)
         else:
             print("Provide --plan or --items", file=sys.stderr)
             sys.exit(1)
 
     location_id = args.location or os.getenv("KROGER_LOCATION_ID")
 
-    print("Building grocery cart...", file=sys.stderr)
-    cart = build_grocery_cart(args.plan, location_id, items_json=args.items)
+    if args.dry_run_fetch:
+        print("Prefetching Kroger searches...", file=sys.stderr)
+        summary = build_grocery_cart(
+            args.plan, location_id, items_json=args.items, fetch_only=True
+        )
+        write_json(summary)
+        return
 
-    output_path = (
-        Path(args.output)
-        if args.output
-        else (Path(__file__).resolve().parent.parent / ".tmp" / "grocery_cart.json")
+    print("Building grocery cart...", file=sys.stderr)
+    cart = build_grocery_cart(
+        args.plan,
+        location_id,
+        items_json=args.items,
+        use_cache=not args.no_cache,
+        rerank_cache=args.rerank_cache,
     )
+
+    output_path = Path(args.output) if args.output else CART_PATH
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(cart, indent=2))
+    output_path.write_bytes(json_dumpb(cart, indent=2))
 
     print(f"\nGrocery cart saved to {output_path}", file=sys.stderr)
     print(
@@ -390,7 +667,7 @@ def main():
         for nf in cart["not_found"]:
             print(f"  - {nf['item']} ({nf['quantity']} {nf['unit']})", file=sys.stderr)
 
-    print(json.dumps(cart, indent=2))
+    write_json(cart)
 
 
 if __name__ == "__main__":
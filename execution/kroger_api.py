@@ -18,6 +18,9 @@ Usage:
     # Add items to cart (requires user auth)
     python kroger_api.py cart-add --items '[{"upc":"0001111041700","quantity":2}]'
 
+    # Bypass the on-disk response cache (.tmp/kroger_cache.sqlite)
+    python kroger_api.py --no-cache search --query "chicken breast" --location 01400943
+
 Environment:
     KROGER_CLIENT_ID       - App client ID from developer.kroger.com
     KROGER_CLIENT_SECRET   - App client secret
@@ -32,24 +35,120 @@ import base64
 import json
 import os
 import sys
+import threading
 import time
 import urllib.parse
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-from meal_config import load_env
+# Skip if already on sys.path (always true when run as a script)
+_EXEC_DIR = str(Path(__file__).parent)
+if _EXEC_DIR not in sys.path:
+    sys.path.insert(0, _EXEC_DIR)
+from meal_config import ROOT_DIR, json_dumpb, json_loads, load_env, write_json
 
 load_env()
 
+import kroger_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://api.kroger.com/v1"
 AUTH_URL = "https://api.kroger.com/v1/connect/oauth2"
 
+TOKEN_PATH = ROOT_DIR / ".tmp" / "kroger_tokens.json"
+
+# How long cached GET responses stay fresh
+PRODUCT_CACHE_TTL = 6 * 3600
+LOCATION_CACHE_TTL = 30 * 24 * 3600
+
+# Kroger allows 10k product calls/day; stay polite at ~5 requests/sec
+RATE_LIMIT_PER_SEC = 5
+RATE_LIMIT_BURST = 5
+
+# Fields of a product search hit that the CLI and grocery scorer read. Search
+# results are trimmed to these before caching; images, aisle locations,
+# temperature, country of origin etc. are dropped.
+_PRODUCT_FIELDS = (
+    "productId",
+    "upc",
+    "description",
+    "brand",
+    "categories",
+    "snapEligible",
+)
+_PRODUCT_ITEM_FIELDS = ("price", "size", "inventory", "fulfillment")
+
+
+def _slim_search_results(body):
+    """Project a /products search response down to the fields we use."""
+    slim = []
+    for p in body.get("data", []):
+        product = {k: p[k] for k in _PRODUCT_FIELDS if k in p}
+        items = p.get("items") or []
+        if items:
+            product["items"] = [
+                {k: items[0][k] for k in _PRODUCT_ITEM_FIELDS if k in items[0]}
+            ]
+        slim.append(product)
+    return {"data": slim}
+
+
+def _make_session():
+    """
+    One keep-alive session for all Kroger calls so TLS is negotiated once.
+    Only GETs are retried: a replayed cart PUT could add items twice.
+
+    The session is shared by grocery_list's worker threads; the pool holds a
+    connection per worker, so concurrent searches never queue behind each
+    other or behind a token refresh on a single connection. That is why
+    this stays a sync requests client rather than an async HTTP/2 one.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET"]),
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+class RateLimiter:
+    """Thread-safe token bucket: bursts of up to `burst` calls, then `rate`/sec."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping only if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            # Reserve a token now (possibly going negative) so waiting threads
+            # queue up in order instead of racing for the next refill
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
 
 class KrogerAuth:
     """Handles OAuth2 for Kroger API (client credentials + authorization code)."""
 
+    # Saved token data by token file path, shared by every KrogerAuth in the
+    # process so the file is read at most once and never re-read after a save
+    _token_cache = {}
+
     def __init__(self, client_id=None, client_secret=None, redirect_uri=None):
         self.client_id = client_id or os.getenv("KROGER_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("KROGER_CLIENT_SECRET")
@@ -65,12 +164,15 @@ class KrogerAuth:
         self._user_token = None
         self._user_token_expires = 0
         self._refresh_token = os.getenv("KROGER_REFRESH_TOKEN")
+        # Guards token refresh when the client is shared across worker threads
+        self._lock = threading.Lock()
 
-        # Try loading saved tokens
-        self._token_file = (
-            Path(__file__).resolve().parent.parent / ".tmp" / "kroger_tokens.json"
-        )
-        self._load_tokens()
+        # Saved user tokens are only needed for cart operations, so the file
+        # is read on first use rather than on every client construction
+        self._token_file = TOKEN_PATH
+        self._tokens_loaded = False
+
+        self.session = _make_session()
 
     def _basic_auth(self):
         creds = base64.b64encode(
@@ -86,25 +188,46 @@ class KrogerAuth:
         if self._user_token:
             data["user_token"] = self._user_token
             data["user_token_expires"] = self._user_token_expires
-        self._token_file.write_text(json.dumps(data))
+        # Write then rename so a crash mid-write can't leave a corrupt file
+        tmp = self._token_file.with_suffix(".json.tmp")
+        tmp.write_bytes(json_dumpb(data))
+        os.replace(tmp, self._token_file)
+        KrogerAuth._token_cache[self._token_file] = data
 
     def _load_tokens(self):
-        if self._token_file.exists():
+        data = KrogerAuth._token_cache.get(self._token_file)
+        if data is None:
             try:
-                data = json.loads(self._token_file.read_text())
-                if not self._refresh_token:
-                    self._refresh_token = data.get("refresh_token")
-                self._user_token = data.get("user_token")
-                self._user_token_expires = data.get("user_token_expires", 0)
+                data = json_loads(self._token_file.read_bytes())
             except (json.JSONDecodeError, OSError):
-                pass
+                return
+            KrogerAuth._token_cache[self._token_file] = data
+        if not self._refresh_token:
+            self._refresh_token = data.get("refresh_token")
+        self._user_token = data.get("user_token")
+        self._user_token_expires = data.get("user_token_expires", 0)
+
+    def _ensure_tokens_loaded(self):
+        if self._tokens_loaded:
+            return
+        with self._lock:
+            if not self._tokens_loaded:
+                self._load_tokens()
+                self._tokens_loaded = True
 
     def get_app_token(self, scope="product.compact"):
         """Get client-credentials token for public endpoints (products, locations)."""
         if self._app_token and time.time() < self._app_token_expires:
             return self._app_token
 
-        resp = requests.post(
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._app_token and time.time() < self._app_token_expires:
+                return self._app_token
+            return self._fetch_app_token(scope)
+
+    def _fetch_app_token(self, scope):
+        resp = self.session.post(
             f"{AUTH_URL}/token",
             headers={
                 "Authorization": self._basic_auth(),
@@ -114,7 +237,7 @@ class KrogerAuth:
             timeout=15,
         )
         resp.raise_for_status()
-        body = resp.json()
+        body = json_loads(resp.content)
         self._app_token = body["access_token"]
         self._app_token_expires = time.time() + body["expires_in"] - 60
         return self._app_token
@@ -131,7 +254,8 @@ class KrogerAuth:
 
     def exchange_code(self, code):
         """Exchange authorization code for user tokens."""
-        resp = requests.post(
+        self._ensure_tokens_loaded()
+        resp = self.session.post(
             f"{AUTH_URL}/token",
             headers={
                 "Authorization": self._basic_auth(),
@@ -145,7 +269,7 @@ class KrogerAuth:
             timeout=15,
         )
         resp.raise_for_status()
-        body = resp.json()
+        body = json_loads(resp.content)
         self._user_token = body["access_token"]
         self._user_token_expires = time.time() + body["expires_in"] - 60
         self._refresh_token = body.get("refresh_token", self._refresh_token)
@@ -154,6 +278,7 @@ class KrogerAuth:
 
     def get_user_token(self):
         """Get user token (refresh if expired). Required for cart operations."""
+        self._ensure_tokens_loaded()
         if self._user_token and time.time() < self._user_token_expires:
             return self._user_token
 
@@ -162,7 +287,7 @@ class KrogerAuth:
                 "No refresh token. Run 'python kroger_api.py auth' to authorize."
             )
 
-        resp = requests.post(
+        resp = self.session.post(
             f"{AUTH_URL}/token",
             headers={
                 "Authorization": self._basic_auth(),
@@ -172,7 +297,7 @@ class KrogerAuth:
             timeout=15,
         )
         resp.raise_for_status()
-        body = resp.json()
+        body = json_loads(resp.content)
         self._user_token = body["access_token"]
         self._user_token_expires = time.time() + body["expires_in"] - 60
         self._refresh_token = body.get("refresh_token", self._refresh_token)
@@ -181,14 +306,19 @@ class KrogerAuth:
 
     @property
     def has_user_auth(self):
+        self._ensure_tokens_loaded()
         return bool(self._refresh_token)
 
 
 class KrogerClient:
     """High-level Kroger API client."""
 
-    def __init__(self, auth=None):
+    def __init__(self, auth=None, use_cache=True, cache_only=False):
         self.auth = auth or KrogerAuth()
+        self.use_cache = use_cache
+        # Serve GETs from the disk cache only; misses raise instead of calling out
+        self.cache_only = cache_only
+        self.rate_limiter = RateLimiter(RATE_LIMIT_PER_SEC, RATE_LIMIT_BURST)
 
     def _app_headers(self, scope="product.compact"):
         return {
@@ -203,27 +333,51 @@ class KrogerClient:
             "Content-Type": "application/json",
         }
 
+    def _cached_get(self, url, params, ttl, project=None):
+        """
+        GET a public (app-token) endpoint, serving from the disk cache when fresh.
+        project, if given, trims the decoded body before it is cached and returned.
+        """
+        key = kroger_cache.cache_key(url, params)
+        if self.use_cache:
+            cached = kroger_cache.get(key)
+            if cached is not None:
+                return cached
+        if self.cache_only:
+            raise LookupError(f"No cached response for {url}")
+        self.rate_limiter.acquire()
+        resp = self.auth.session.get(
+            url,
+            headers=self._app_headers("product.compact"),
+            params=params,
+            timeout=15,
+        )
+        resp.raise_for_status()
+        data = json_loads(resp.content)
+        if project:
+            data = project(data)
+        if self.use_cache:
+            kroger_cache.set(key, data, ttl)
+        return data
+
     # ── Locations ──────────────────────────────────────────────────────
 
     def find_stores(self, zip_code, radius_miles=10, limit=5):
         """Find Kroger stores near a ZIP code."""
-        resp = requests.get(
+        return self._cached_get(
             f"{BASE_URL}/locations",
-            headers=self._app_headers("product.compact"),
-            params={
+            {
                 "filter.zipCode.near": zip_code,
                 "filter.radiusInMiles": radius_miles,
                 "filter.limit": limit,
             },
-            timeout=15,
+            LOCATION_CACHE_TTL,
         )
-        resp.raise_for_status()
-        return resp.json()
 
     # ── Products ───────────────────────────────────────────────────────
 
     def search_products(self, query, location_id, limit=10, fulfillment=None):
-        """Search products at a specific store."""
+        """Search products at a specific store (results trimmed to _PRODUCT_FIELDS)."""
         params = {
             "filter.term": query,
             "filter.locationId": location_id,
@@ -231,25 +385,20 @@ class KrogerClient:
         }
         if fulfillment:
             params["filter.fulfillment"] = fulfillment
-        resp = requests.get(
+        return self._cached_get(
             f"{BASE_URL}/products",
-            headers=self._app_headers("product.compact"),
-            params=params,
-            timeout=15,
+            params,
+            PRODUCT_CACHE_TTL,
+            project=_slim_search_results,
         )
-        resp.raise_for_status()
-        return resp.json()
 
     def get_product(self, product_id, location_id):
         """Get detailed product info including price and availability."""
-        resp = requests.get(
+        return self._cached_get(
             f"{BASE_URL}/products/{product_id}",
-            headers=self._app_headers("product.compact"),
-            params={"filter.locationId": location_id},
-            timeout=15,
+            {"filter.locationId": location_id},
+            PRODUCT_CACHE_TTL,
         )
-        resp.raise_for_status()
-        return resp.json()
 
     # ── Cart ───────────────────────────────────────────────────────────
 
@@ -272,7 +421,8 @@ class KrogerClient:
                 for item in items
             ]
         }
-        resp = requests.put(
+        self.rate_limiter.acquire()
+        resp = self.auth.session.put(
             f"{BASE_URL}/cart/add",
             headers=self._user_headers(),
             json=payload,
@@ -323,7 +473,7 @@ def cmd_stores(args, client):
                 "phone": s.get("phone", ""),
             }
         )
-    print(json.dumps(output, indent=2))
+    write_json(output)
 
 
 def cmd_search(args, client):
@@ -354,7 +504,7 @@ def cmd_search(args, client):
                 "fulfillment": item.get("fulfillment", {}),
             }
         )
-    print(json.dumps(output, indent=2))
+    write_json(output)
 
 
 def cmd_product(args, client):
@@ -364,18 +514,21 @@ def cmd_product(args, client):
         print("--location or KROGER_LOCATION_ID required")
         sys.exit(1)
     result = client.get_product(args.id, location_id)
-    print(json.dumps(result.get("data", {}), indent=2))
+    write_json(result.get("data", {}))
 
 
 def cmd_cart_add(args, client):
     """Add items to cart."""
-    items = json.loads(args.items)
+    items = json_loads(args.items)
     result = client.add_to_cart(items)
-    print(json.dumps(result, indent=2))
+    write_json(result)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Kroger API CLI")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass the on-disk response cache"
+    )
     sub = parser.add_subparsers(dest="command")
 
     # auth
@@ -409,7 +562,7 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    client = KrogerClient()
+    client = KrogerClient(use_cache=not args.no_cache)
 
     commands = {
         "auth": cmd_auth,
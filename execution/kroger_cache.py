@@ -0,0 +1,84 @@
+"""
+On-disk cache for Kroger API GET responses.
+
+Product and store data change slowly, so repeat grocery list runs can be
+served from .tmp/kroger_cache.sqlite instead of hitting the API again.
+
+Programmatic:
+    from kroger_cache import cache_key, get, set
+    key = cache_key(url, params)
+    data = get(key)  # None on miss or expiry
+    set(key, data, ttl=6 * 3600)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from meal_config import ROOT_DIR, json_dumpb, json_loads
+
+CACHE_PATH = ROOT_DIR / ".tmp" / "kroger_cache.sqlite"
+
+# One connection shared by all worker threads, serialized by a lock
+_conn = None
+_lock = threading.Lock()
+
+
+def _connect():
+    global _conn
+    if _conn is None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(str(CACHE_PATH), check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        _conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        _conn.commit()
+    return _conn
+
+
+def cache_key(url, params):
+    """Stable key for a GET request (auth headers are deliberately excluded)."""
+    raw = json.dumps({"u": url, "p": params}, sort_keys=True)
+    return hashlib.blake2b(raw.encode()).hexdigest()
+
+
+def get(key):
+    """Return the cached JSON value for key, or None if missing or expired."""
+    with _lock:
+        try:
+            row = (
+                _connect()
+                .execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                )
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError):
+            return None
+    if not row or row[1] < time.time():
+        return None
+    try:
+        return json_loads(row[0])
+    except json.JSONDecodeError:
+        return None
+
+
+def set(key, value, ttl):
+    """Store a JSON-serializable value for ttl seconds."""
+    blob = json_dumpb(value)
+    with _lock:
+        try:
+            conn = _connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, blob, time.time() + ttl),
+            )
+            conn.commit()
+        except (sqlite3.Error, OSError):
+            # The cache is an optimization; never fail a request over it
+            pass
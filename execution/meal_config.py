@@ -11,15 +11,72 @@ Usage:
 Programmatic:
     from meal_config import load_config
     config = load_config()  # Returns dict with all defaults
+
+    from meal_config import json_dumps, json_loads  # orjson when installed
+    from meal_config import write_json  # indented JSON to a file/stdout
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
 from pathlib import Path
 
-CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.json"
+# --- JSON ---
+# Use orjson when available (much faster on large API responses), fall back
+# to the stdlib. orjson only supports 2-space indentation, which is all we use.
+
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumpb(obj, indent=None):
+        """Serialize to UTF-8 bytes; any truthy indent means 2 spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+except ImportError:
+
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumpb(obj, indent=None):
+        """Serialize to UTF-8 bytes; any truthy indent means 2 spaces."""
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def json_dumps(obj, indent=None):
+    """Serialize to str; any truthy indent means 2 spaces."""
+    return json_dumpb(obj, indent).decode()
+
+
+def write_json(obj, path=None, indent=True):
+    """
+    Write obj as JSON plus a newline to path (or stdout), 2-space indented
+    unless indent is false. The document is serialized in one call (orjson
+    when installed) and the UTF-8 bytes are written to the file/stdout buffer
+    with no str round-trip.
+    """
+    data = json_dumpb(obj, indent=indent) + b"\n"
+    if path is None:
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            # Redirected to a text-only stream (e.g. io.StringIO)
+            sys.stdout.write(data.decode())
+            return
+        # Keep ordering with anything already printed through sys.stdout
+        sys.stdout.flush()
+        buffer.write(data)
+        return
+    Path(path).write_bytes(data)
+
+
+ROOT_DIR = Path(__file__).parent.parent
+CONFIG_PATH = ROOT_DIR / "config.json"
+# Written by meal_planner.py, read by grocery_list.py and recipe_manager.py
+MEAL_PLAN_PATH = ROOT_DIR / ".tmp" / "meal_plan.json"
 
 GENERIC_DEFAULTS = {
     "zip": "",
@@ -48,20 +105,23 @@ FIELD_PROMPTS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def load_env():
-    """Load env vars from .env file and ~/.openclaw/openclaw.json skill config."""
-    env_file = Path(__file__).resolve().parent.parent / ".env"
+    """Load env vars from .env file and ~/.openclaw/openclaw.json skill config.
+
+    Every execution module calls this on import; only the first call does work.
+    """
     try:
         from dotenv import load_dotenv
 
-        load_dotenv(env_file)
+        load_dotenv(ROOT_DIR / ".env")
     except ImportError:
         pass
 
     oc_config = Path.home() / ".openclaw" / "openclaw.json"
     if oc_config.exists():
         try:
-            config = json.loads(oc_config.read_text())
+            config = json_loads(oc_config.read_bytes())
             env_vars = (
                 config.get("skills", {})
                 .get("entries", {})
@@ -75,15 +135,40 @@ def load_env():
             pass
 
 
+# Parsed config.json as (st_mtime_ns, config); None until first load
+_config_cache = None
+
+
+def clear_config_cache():
+    """Forget the parsed config.json so the next load_config() re-reads it."""
+    global _config_cache
+    _config_cache = None
+
+
 def load_config():
-    """Load config with fallbacks: config.json > env vars (ZIP) > generic defaults."""
-    config = dict(GENERIC_DEFAULTS)
+    """Load config with fallbacks: config.json > env vars (ZIP) > generic defaults.
 
-    if CONFIG_PATH.exists():
-        saved = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    config.json is parsed once and re-read only when its mtime changes.
+    Callers get their own copy and may mutate it freely.
+    """
+    global _config_cache
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if _config_cache is None or _config_cache[0] != mtime:
+        config = dict(GENERIC_DEFAULTS)
+        try:
+            saved = json_loads(CONFIG_PATH.read_bytes())
+        except FileNotFoundError:
+            saved = {}
         for key in GENERIC_DEFAULTS:
             if key in saved and saved[key] != "":
                 config[key] = saved[key]
+        _config_cache = (mtime, config)
+
+    config = dict(_config_cache[1])
 
     # Env var override for ZIP (since it's also in .env for Kroger API)
     env_zip = os.getenv("KROGER_ZIP", "")
@@ -95,7 +180,8 @@ def load_config():
 
 def save_config(config):
     """Save config to config.json."""
-    CONFIG_PATH.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    write_json(config, CONFIG_PATH)
+    clear_config_cache()
 
 
 def cmd_setup(_args):
@@ -170,6 +256,7 @@ def cmd_reset(_args):
     """Delete config.json."""
     if CONFIG_PATH.exists():
         CONFIG_PATH.unlink()
+        clear_config_cache()
         print(f"Deleted {CONFIG_PATH}")
     else:
         print("No config.json to delete.")
@@ -15,6 +15,9 @@ Usage:
     # With saved recipes from Obsidian vault
     python meal_planner.py --recipes-vault ~/Documents/ShuperBrain/30\ Resources/Recipes
 
+    # Ignore a cached plan for the same request and ask the LLM again
+    python meal_planner.py --no-cache
+
 Output: JSON with meal_plan and grocery_list written to .tmp/meal_plan.json
 
 Environment:
@@ -22,19 +25,42 @@ Environment:
 """
 
 import argparse
-import json
+import functools
+import hashlib
 import os
 import sys
+import time
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-from meal_config import load_config, load_env
+# Skip if already on sys.path (always true when run as a script)
+_EXEC_DIR = str(Path(__file__).parent)
+if _EXEC_DIR not in sys.path:
+    sys.path.insert(0, _EXEC_DIR)
+from meal_config import (
+    MEAL_PLAN_PATH,
+    ROOT_DIR,
+    json_dumpb,
+    json_dumps,
+    json_loads,
+    load_config,
+    load_env,
+    write_json,
+)
 
 load_env()
 
-import anthropic
 from recipe_manager import load_all_recipes, recipe_to_export_dict
 
+PCOS_REF_PATH = ROOT_DIR / "references" / "pcos.md"
+
+MODEL = "claude-sonnet-4-5-20250929"
+MAX_TOKENS = 4096
+
+# Plans for an identical request (same prompt, model and limits) are reused
+# for this long instead of calling the LLM again
+PLAN_CACHE_DIR = ROOT_DIR / ".tmp" / "meal_plan_cache"
+PLAN_CACHE_TTL = 12 * 3600
+
 SYSTEM_PROMPT = """You are a meal planning assistant. You create practical, budget-conscious weekly meal plans.
 
 Key rules:
@@ -75,12 +101,43 @@ Aggregate ingredients across all meals into a single grocery_list (combine dupli
 Estimate prices based on typical US grocery prices."""
 
 
+@functools.lru_cache(maxsize=1)
 def load_pcos_reference():
-    """Load PCOS dietary reference if available."""
-    ref_path = Path(__file__).resolve().parent.parent / "references" / "pcos.md"
-    if ref_path.exists():
-        return ref_path.read_text(encoding="utf-8")
-    return None
+    """Load PCOS dietary reference if available (read once per process)."""
+    try:
+        return PCOS_REF_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _plan_cache_path(user_msg):
+    """Cache file for a request; the key covers everything sent to the LLM."""
+    key = hashlib.sha256(json_dumpb([MODEL, MAX_TOKENS, SYSTEM_PROMPT, user_msg]))
+    return PLAN_CACHE_DIR / f"{key.hexdigest()}.json"
+
+
+def _read_cached_plan(path):
+    """Return the cached plan at path, or None if missing, expired or corrupt."""
+    try:
+        if time.time() - path.stat().st_mtime > PLAN_CACHE_TTL:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_plan(path, plan):
+    """Save a plan to the cache and drop expired entries."""
+    PLAN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    with os.scandir(PLAN_CACHE_DIR) as it:
+        for entry in it:
+            try:
+                if now - entry.stat().st_mtime > PLAN_CACHE_TTL:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+    path.write_bytes(json_dumpb(plan))
 
 
 def generate_meal_plan(
@@ -90,8 +147,12 @@ def generate_meal_plan(
     preferences=None,
     saved_recipes=None,
     zip_code=None,
+    use_cache=True,
 ):
-    """Generate a meal plan using the LLM."""
+    """
+    Generate a meal plan using the LLM. An identical request made within
+    PLAN_CACHE_TTL returns the saved plan unless use_cache is False.
+    """
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY is required")
@@ -102,46 +163,79 @@ def generate_meal_plan(
     household = household or config["household"]
     zip_code = zip_code or config["zip"]
 
-    user_msg = f"""Create a {meals}-meal weekly dinner plan.
-
-Household: {household}
-Budget: ${budget}/week
-Location ZIP: {zip_code}"""
+    # Collect lines and join once so the large tail sections (PCOS reference,
+    # saved recipes JSON) are copied a single time
+    parts = [
+        f"Create a {meals}-meal weekly dinner plan.",
+        "",
+        f"Household: {household}",
+        f"Budget: ${budget}/week",
+        f"Location ZIP: {zip_code}",
+    ]
 
     if config["diet"]:
-        user_msg += f"\nDiet: {config['diet']}"
+        parts.append(f"Diet: {config['diet']}")
     if config["friday_rule"]:
-        user_msg += f"\nFriday rule: {config['friday_rule']}"
+        parts.append(f"Friday rule: {config['friday_rule']}")
     if config["leftovers"]:
-        user_msg += f"\nLeftovers: {config['leftovers']}"
+        parts.append(f"Leftovers: {config['leftovers']}")
 
     if preferences:
-        user_msg += f"\nAdditional preferences: {preferences}"
+        parts.append(f"Additional preferences: {preferences}")
 
     pcos_ref = load_pcos_reference()
     if pcos_ref:
-        user_msg += f"\n\nPCOS Dietary Reference:\n{pcos_ref}"
+        parts += ["", "PCOS Dietary Reference:", pcos_ref]
 
     if saved_recipes:
-        user_msg += f"\n\nIncorporate these saved recipes if appropriate:\n{json.dumps(saved_recipes, indent=2)}"
+        parts += [
+            "",
+            "Incorporate these saved recipes if appropriate:",
+            json_dumps(saved_recipes, indent=2),
+        ]
+
+    user_msg = "\n".join(parts)
+
+    cache_path = _plan_cache_path(user_msg)
+    if use_cache:
+        plan = _read_cached_plan(cache_path)
+        if plan is not None:
+            print("Using cached meal plan (--no-cache to regenerate)", file=sys.stderr)
+            return plan
+
+    # Imported here: the SDK takes most of a second to import and only this
+    # path needs it
+    import anthropic
 
     client = anthropic.Anthropic(api_key=api_key)
     response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=4096,
-        system=SYSTEM_PROMPT,
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        # The system prompt never changes; mark it for server-side prompt
+        # caching (applied once the cached prefix is long enough)
+        system=[
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
         messages=[{"role": "user", "content": user_msg}],
     )
 
     text = response.content[0].text.strip()
-    # Strip markdown code fences if present
+    # Strip markdown code fences (and any ```json tag) if present
     if text.startswith("```"):
-        text = text.split("\n", 1)[1]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
+        text = text.partition("\n")[2].removesuffix("```").strip()
 
-    return json.loads(text)
+    plan = json_loads(text)
+    # Check the shape downstream steps rely on before caching the plan
+    if not isinstance(plan, dict) or not all(
+        isinstance(plan.get(key), list) for key in ("meal_plan", "grocery_list")
+    ):
+        raise ValueError("LLM response is missing meal_plan or grocery_list")
+    _write_cached_plan(cache_path, plan)
+    return plan
 
 
 def main():
@@ -164,11 +258,16 @@ def main():
     )
     parser.add_argument("--zip", help="ZIP code (from config if not set)")
     parser.add_argument("--output", help="Output file (default: .tmp/meal_plan.json)")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, even if an identical request was cached",
+    )
     args = parser.parse_args()
 
     saved_recipes = None
     if args.recipes_file:
-        saved_recipes = json.loads(Path(args.recipes_file).read_text())
+        saved_recipes = json_loads(Path(args.recipes_file).read_bytes())
     elif args.recipes_vault:
         vault_recipes = load_all_recipes(Path(args.recipes_vault))
         if vault_recipes:
@@ -182,20 +281,17 @@ def main():
         preferences=args.preferences,
         saved_recipes=saved_recipes,
         zip_code=args.zip,
+        use_cache=not args.no_cache,
     )
 
-    output_path = (
-        Path(args.output)
-        if args.output
-        else (Path(__file__).resolve().parent.parent / ".tmp" / "meal_plan.json")
-    )
+    output_path = Path(args.output) if args.output else MEAL_PLAN_PATH
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(plan, indent=2))
+    write_json(plan, output_path)
 
     print(f"Meal plan saved to {output_path}", file=sys.stderr)
 
     # Also print to stdout for piping
-    print(json.dumps(plan, indent=2))
+    write_json(plan)
 
 
 if __name__ == "__main__":
@@ -28,15 +28,26 @@ Environment:
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-from meal_config import load_env
+# Skip if already on sys.path (always true when run as a script)
+_EXEC_DIR = str(Path(__file__).parent)
+if _EXEC_DIR not in sys.path:
+    sys.path.insert(0, _EXEC_DIR)
+from meal_config import (
+    MEAL_PLAN_PATH,
+    json_loads,
+    load_env,
+    write_json,
+)
 
 load_env()
 
@@ -44,55 +55,73 @@ DEFAULT_VAULT_PATH = os.path.join(
     os.path.expanduser("~"), "Documents", "ShuperBrain", "30 Resources", "Recipes"
 )
 
+# Recipe files read/parsed concurrently when loading the vault
+MAX_WORKERS = 32
+
 # --- YAML frontmatter parsing ---
-# Try PyYAML for robust parsing, fall back to simple regex parser
-
-try:
-    import yaml
-
-    def _parse_yaml(text):
-        return yaml.safe_load(text) or {}
-
-    def _dump_yaml(data):
-        return yaml.dump(data, default_flow_style=False, sort_keys=False).rstrip()
-
-except ImportError:
-
-    def _parse_yaml(text):
-        """Minimal YAML parser for flat key-value frontmatter."""
-        result = {}
-        for line in text.strip().split("\n"):
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            if value.startswith("[") and value.endswith("]"):
-                result[key] = [
-                    v.strip().strip("\"'") for v in value[1:-1].split(",") if v.strip()
-                ]
-            elif value.isdigit():
-                result[key] = int(value)
-            elif value.startswith('"') and value.endswith('"'):
-                result[key] = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                result[key] = value[1:-1]
-            else:
-                result[key] = value
-        return result
-
-    def _dump_yaml(data):
-        """Minimal YAML serializer for flat key-value frontmatter."""
-        lines = []
-        for key, value in data.items():
-            if isinstance(value, list):
-                formatted = "[" + ", ".join(f'"{v}"' for v in value) + "]"
-                lines.append(f"{key}: {formatted}")
-            elif isinstance(value, int):
-                lines.append(f"{key}: {value}")
-            else:
-                lines.append(f'{key}: "{value}"')
-        return "\n".join(lines)
+# Use PyYAML for robust parsing, fall back to a simple flat parser. PyYAML is
+# imported on first use so commands that never touch frontmatter skip it.
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Return (yaml module, loader class), or None if PyYAML isn't installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    # LibYAML's C loader when PyYAML was built with it (same safe semantics)
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml(text):
+    lib = _yaml()
+    if lib is None:
+        return _parse_flat_yaml(text)
+    yaml, loader = lib
+    return yaml.load(text, Loader=loader) or {}
+
+
+def _dump_yaml(data):
+    lib = _yaml()
+    if lib is None:
+        return _dump_flat_yaml(data)
+    return lib[0].dump(data, default_flow_style=False, sort_keys=False).rstrip()
+
+
+def _parse_flat_yaml(text):
+    """Minimal YAML parser for flat key-value frontmatter."""
+    result = {}
+    for line in text.strip().split("\n"):
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        value = value.strip()
+        first = value[:1]
+        if first == "[" and value.endswith("]"):
+            value = [
+                v.strip().strip("\"'") for v in value[1:-1].split(",") if v.strip()
+            ]
+        elif value.isdigit():
+            value = int(value)
+        elif first and first in "\"'" and value.endswith(first):
+            value = value[1:-1]
+        result[key.strip()] = value
+    return result
+
+
+def _dump_flat_yaml(data):
+    """Minimal YAML serializer for flat key-value frontmatter."""
+    lines = []
+    for key, value in data.items():
+        if isinstance(value, list):
+            formatted = "[" + ", ".join(f'"{v}"' for v in value) + "]"
+            lines.append(f"{key}: {formatted}")
+        elif isinstance(value, int):
+            lines.append(f"{key}: {value}")
+        else:
+            lines.append(f'{key}: "{value}"')
+    return "\n".join(lines)
 
 
 def get_vault_path():
@@ -101,10 +130,35 @@ def get_vault_path():
 
 def parse_frontmatter(content):
     """Extract YAML frontmatter dict and markdown body from file content."""
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", content, re.DOTALL)
-    if not match:
+    fm, body = _split_frontmatter(content)
+    if fm is None:
         return {}, content
-    return _parse_yaml(match.group(1)), match.group(2)
+    return _parse_yaml(fm), body
+
+
+def _split_frontmatter(content):
+    """
+    Split content into (frontmatter text, body), or (None, None) if there is
+    no frontmatter. Plain str scans; equivalent to the former
+    ^---\\s*\\n(.*?)\\n---\\s*\\n?(.*) DOTALL regex.
+    """
+    if not content.startswith("---"):
+        return None, None
+    # The opening fence runs through the last newline of its trailing whitespace
+    i = 3
+    while i < len(content) and content[i].isspace():
+        i += 1
+    start = content.rfind("\n", 3, i)
+    if start < 0:
+        return None, None
+    end = content.find("\n---", start + 1)
+    if end < 0:
+        # "---\n\n---": the fence's last newline also opens the closing fence
+        prev = content.rfind("\n", 3, start)
+        if prev < 0 or not content.startswith("---", start + 1):
+            return None, None
+        start, end = prev, start
+    return content[start + 1 : end], content[end + 4 :].lstrip()
 
 
 def write_frontmatter(metadata, body):
@@ -112,55 +166,203 @@ def write_frontmatter(metadata, body):
     return f"---\n{_dump_yaml(metadata)}\n---\n\n{body}"
 
 
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=512)
 def slugify(text):
     """Convert text to a filename-safe slug."""
     text = text.lower()
-    text = re.sub(r"[^a-z0-9\s-]", "", text)
-    text = re.sub(r"[\s]+", "-", text)
+    text = _SLUG_STRIP_RE.sub("", text)
+    text = _SLUG_SPACE_RE.sub("-", text)
     return text.strip("-")
 
 
-def load_all_recipes(vault_path):
-    """Load all .md recipes from the vault directory."""
-    if not vault_path.exists():
+# Parsed vault headers for this process:
+#   str(vault_path) -> {"signature", "recipes", "index"}
+# The signature is each file's (name, mtime, size), so edits, adds and deletes
+# made outside this process still force a reload.
+_vault_cache = {}
+
+# Characters read per step when scanning a file for its frontmatter
+_HEAD_CHARS = 512
+
+
+def clear_vault_cache():
+    """Drop parsed vaults so the next load re-reads every recipe file."""
+    _vault_cache.clear()
+
+
+def _map_files(fn, items):
+    """
+    fn over items on a thread pool, in order. Reads release the GIL, so the
+    pool overlaps file I/O across the vault.
+    """
+    if not items:
         return []
-    recipes = []
-    for md_file in sorted(vault_path.glob("*.md")):
-        if md_file.name == "_Recipe Index.md":
-            continue
-        content = md_file.read_text(encoding="utf-8")
-        metadata, body = parse_frontmatter(content)
-        recipes.append(
-            {
-                "file_path": str(md_file),
-                "filename": md_file.name,
-                "metadata": metadata,
-                "body": body,
-            }
-        )
-    return recipes
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _load_vault(vault_path, bodies=False):
+    """
+    Return the cache entry for vault_path, (re)parsing it if files changed.
+    With bodies=True every recipe's body is loaded too, reading each file
+    once on a cold cache.
+    """
+    try:
+        # scandir's DirEntry carries the file type, so no extra stat per file
+        with os.scandir(vault_path) as it:
+            entries = [
+                e
+                for e in it
+                if e.name.endswith(".md")
+                and e.name != "_Recipe Index.md"
+                and e.is_file()
+            ]
+    except FileNotFoundError:
+        return {"signature": None, "recipes": [], "index": None}
+    entries.sort(key=lambda e: e.name)
+    # DirEntry.stat() is cached on the entry, so this is one stat per file
+    signature = tuple((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in entries)
+
+    key = str(vault_path)
+    cached = _vault_cache.get(key)
+    if cached and cached["signature"] == signature:
+        if bodies:
+            _map_files(
+                load_recipe_full, [r for r in cached["recipes"] if r["body"] is None]
+            )
+        return cached
+
+    loader = _load_recipe_file if bodies else _load_recipe_header
+    cached = {
+        "signature": signature,
+        "recipes": _map_files(loader, entries),
+        "index": None,
+    }
+    _vault_cache[key] = cached
+    return cached
+
+
+def _load_recipe_file(entry):
+    """Read and parse one whole vault .md file (an os.DirEntry)."""
+    with open(entry.path, "rb") as f:
+        content = f.read().decode("utf-8")
+    metadata, body = parse_frontmatter(content)
+    return {
+        "file_path": entry.path,
+        "filename": entry.name,
+        "metadata": metadata,
+        "body": body,
+    }
+
+
+def _load_recipe_header(entry):
+    """
+    Parse only the frontmatter of one vault .md file (an os.DirEntry),
+    reading just far enough to find the closing fence. body stays None
+    until load_recipe_full().
+    """
+    # newline="" keeps \r\n as-is, matching a full bytes read
+    with open(entry.path, encoding="utf-8", newline="") as f:
+        content = f.read(_HEAD_CHARS)
+        while True:
+            fm, _ = _split_frontmatter(content)
+            # A missing or blank match can still change as more text arrives
+            if fm and not fm.isspace():
+                break
+            if not (content.startswith("---") or "---".startswith(content)):
+                break
+            chunk = f.read(len(content) or _HEAD_CHARS)
+            if not chunk:
+                break
+            content += chunk
+    return {
+        "file_path": entry.path,
+        "filename": entry.name,
+        "metadata": _parse_yaml(fm) if fm is not None else {},
+        "body": None,
+    }
+
+
+def load_recipe_full(recipe):
+    """
+    Read the recipe's markdown body on first use; returns the recipe.
+    The metadata is already parsed, so the frontmatter is only split off.
+    """
+    if recipe["body"] is None:
+        with open(recipe["file_path"], "rb") as f:
+            content = f.read().decode("utf-8")
+        fm, body = _split_frontmatter(content)
+        recipe["body"] = content if fm is None else body
+    return recipe
+
+
+def load_recipe_index(vault_path):
+    """
+    Load every recipe's metadata from the vault (cached per process).
+    Bodies are not read; pass a recipe to load_recipe_full() when needed.
+    """
+    return list(_load_vault(vault_path)["recipes"])
+
+
+def load_all_recipes(vault_path):
+    """Load all .md recipes from the vault directory, bodies included."""
+    return list(_load_vault(vault_path, bodies=True)["recipes"])
+
+
+def build_name_index(recipes):
+    """Index recipes by lowercased frontmatter name and by filename slug."""
+    by_name = {}
+    by_slug = {}
+    for recipe in recipes:
+        by_name.setdefault(recipe["metadata"].get("name", "").lower(), recipe)
+        # Vault filenames all end in .md, so the stem is a plain slice
+        by_slug.setdefault(recipe["filename"][:-3], recipe)
+    return by_name, by_slug
+
+
+def lookup_recipe(index, name):
+    """Find a recipe in a build_name_index() result, or None."""
+    by_name, by_slug = index
+    return by_name.get(name.lower()) or by_slug.get(slugify(name))
+
+
+def get_name_index(vault_path):
+    """build_name_index() for the vault, reused while its files are unchanged."""
+    vault = _load_vault(vault_path)
+    if vault["index"] is None:
+        vault["index"] = build_name_index(vault["recipes"])
+    return vault["index"]
 
 
 def find_recipe(vault_path, name):
-    """Find a recipe by name (checks frontmatter name and filename slug)."""
-    slug = slugify(name)
-    for recipe in load_all_recipes(vault_path):
-        meta_name = recipe["metadata"].get("name", "")
-        file_slug = Path(recipe["filename"]).stem
-        if meta_name.lower() == name.lower() or file_slug == slug:
-            return recipe
-    return None
+    """
+    Find a recipe by name (checks frontmatter name and filename slug).
+    Only metadata is loaded; use load_recipe_full() for the body.
+    """
+    return lookup_recipe(get_name_index(vault_path), name)
+
+
+@functools.lru_cache(maxsize=16)
+def _section_pattern(heading):
+    """Compiled pattern for the content under a ## heading."""
+    return re.compile(
+        rf"##\s+{re.escape(heading)}\s*\n(.*?)(?=\n##|\Z)", re.DOTALL | re.IGNORECASE
+    )
 
 
 def extract_section(body, heading):
     """Extract content under a ## heading from markdown body."""
-    pattern = rf"##\s+{re.escape(heading)}\s*\n(.*?)(?=\n##|\Z)"
-    match = re.search(pattern, body, re.DOTALL | re.IGNORECASE)
+    match = _section_pattern(heading).search(body)
     return match.group(1).strip() if match else ""
 
 
 def recipe_to_export_dict(recipe):
     """Convert a vault recipe to the JSON format meal_planner.py expects."""
+    load_recipe_full(recipe)
     meta = recipe["metadata"]
     body = recipe["body"]
     ingredients_text = extract_section(body, "Ingredients")
@@ -187,16 +389,11 @@ INDEX_FILENAME = "_Recipe Index.md"
 
 def _load_current_meal_plan(meal_plan_path=None):
     """Load the current meal plan from JSON. Returns the meal_plan list or None."""
-    if meal_plan_path is None:
-        meal_plan_path = (
-            Path(__file__).resolve().parent.parent / ".tmp" / "meal_plan.json"
-        )
-    else:
-        meal_plan_path = Path(meal_plan_path)
+    meal_plan_path = Path(meal_plan_path) if meal_plan_path else MEAL_PLAN_PATH
     if not meal_plan_path.exists():
         return None
     try:
-        data = json.loads(meal_plan_path.read_text(encoding="utf-8"))
+        data = json_loads(meal_plan_path.read_bytes())
         return data.get("meal_plan")
     except (json.JSONDecodeError, KeyError):
         return None
@@ -204,7 +401,7 @@ def _load_current_meal_plan(meal_plan_path=None):
 
 def generate_index(vault_path, meal_plan_path=None):
     """Rebuild the _Recipe Index.md Obsidian note from scratch."""
-    recipes = [r for r in load_all_recipes(vault_path) if r["metadata"].get("name")]
+    recipes = [r for r in load_recipe_index(vault_path) if r["metadata"].get("name")]
     today = date.today().isoformat()
 
     lines = [
@@ -274,7 +471,7 @@ def generate_index(vault_path, meal_plan_path=None):
 
 def cmd_list(args):
     vault_path = get_vault_path()
-    recipes = load_all_recipes(vault_path)
+    recipes = load_recipe_index(vault_path)
 
     if not recipes:
         print("[]")
@@ -308,17 +505,24 @@ def cmd_list(args):
         }
         for r in recipes
     ]
-    print(json.dumps(output, indent=2))
+    write_json(output)
 
 
 def cmd_show(args):
     vault_path = get_vault_path()
-    recipe = find_recipe(vault_path, args.name)
-    if not recipe:
-        print(f"Recipe not found: {args.name}", file=sys.stderr)
-        sys.exit(1)
+    # Saved recipes are named after their slug, so try that file directly
+    # before scanning the vault for a frontmatter name match
+    try:
+        content = (vault_path / (slugify(args.name) + ".md")).read_text(
+            encoding="utf-8"
+        )
+    except (FileNotFoundError, IsADirectoryError):
+        recipe = find_recipe(vault_path, args.name)
+        if not recipe:
+            print(f"Recipe not found: {args.name}", file=sys.stderr)
+            sys.exit(1)
+        content = Path(recipe["file_path"]).read_text(encoding="utf-8")
     # Print the full file content
-    content = Path(recipe["file_path"]).read_text(encoding="utf-8")
     print(content)
 
 
@@ -353,8 +557,9 @@ def cmd_save(args):
 
     file_path.write_text(write_frontmatter(metadata, body), encoding="utf-8")
     print(f"Saved: {file_path}", file=sys.stderr)
-    print(json.dumps({"file_path": str(file_path), "name": args.name}))
+    write_json({"file_path": str(file_path), "name": args.name}, indent=False)
 
+    clear_vault_cache()
     generate_index(vault_path)
 
 
@@ -363,9 +568,10 @@ def cmd_export(args):
 
     if args.names:
         names = [n.strip() for n in args.names.split(",")]
+        index = get_name_index(vault_path)
         recipes = []
         for name in names:
-            recipe = find_recipe(vault_path, name)
+            recipe = lookup_recipe(index, name)
             if recipe:
                 recipes.append(recipe)
             else:
@@ -374,28 +580,36 @@ def cmd_export(args):
         recipes = load_all_recipes(vault_path)
 
     output = [recipe_to_export_dict(r) for r in recipes]
-    print(json.dumps(output, indent=2))
+    write_json(output)
 
 
 def cmd_update_used(args):
     vault_path = get_vault_path()
     today = date.today().isoformat()
+    index = get_name_index(vault_path)
 
     for name in args.names:
-        recipe = find_recipe(vault_path, name)
+        recipe = lookup_recipe(index, name)
         if not recipe:
             print(f"Warning: recipe not found: {name}", file=sys.stderr)
             continue
 
-        file_path = Path(recipe["file_path"])
+        # One read per recipe (none if its body is already loaded)
+        load_recipe_full(recipe)
         metadata = recipe["metadata"]
         metadata["last_used"] = today
 
-        file_path.write_text(
-            write_frontmatter(metadata, recipe["body"]), encoding="utf-8"
-        )
+        # Write then rename so a crash mid-write can't truncate the note.
+        # Replace the symlink's target (not the link) and keep its mode.
+        file_path = os.path.realpath(recipe["file_path"])
+        tmp = file_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(write_frontmatter(metadata, recipe["body"]))
+        shutil.copymode(file_path, tmp)
+        os.replace(tmp, file_path)
         print(f"Updated last_used: {name} -> {today}", file=sys.stderr)
 
+    clear_vault_cache()
     generate_index(vault_path)
 
 